@@ -9,95 +9,197 @@ This script:
 4. Sets up proper indexing for optimal performance
 """
 
+import logging
 import os
 import sys
 from datetime import datetime
-from pymongo import MongoClient, errors
+from pymongo import MongoClient, IndexModel, ReturnDocument, errors
 from pymongo.collection import Collection
 from pymongo.database import Database
+from pymongo.uri_parser import split_options
+from pymongo.write_concern import WriteConcern
 import json
 from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # Optional C serializer, fall back to stdlib json
+    orjson = None
+
+logger = logging.getLogger('mongo_bootstrap')
+
+# Environment defaults, read once at import time
+_DEFAULT_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27017')
+_DEFAULT_DB = os.getenv('MONGODB_LOGGER_DB', 'mcp_tool_logs')
+_DEFAULT_COLL = os.getenv('MONGODB_LOGGER_COLLECTION', 'tool_executions')
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that leaves flushing to the stream's own buffering instead
+    of flushing after every record; call flush() once output is complete
+    """
+    
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
 
 class MongoLoggerBootstrap:
-    def __init__(self, mongo_uri=None, test_mode=True):
+    __slots__ = (
+        'mongo_uri', 'test_mode', '_client', 'db', 'collection',
+        'connection_info', 'db_name', 'collection_name', 'out_dir', '_bootstrap_now'
+    )
+    
+    def __init__(self, mongo_uri=None, test_mode=True, out_dir='.'):
         """
         Initialize MongoDB Logger Bootstrap
         
         Args:
             mongo_uri (str): MongoDB connection string (defaults to env var or localhost)
             test_mode (bool): If True, creates unique test database with timestamp
+            out_dir (str): Directory the generated configuration files are written to
         """
-        self.mongo_uri = mongo_uri or os.getenv('MONGODB_URI', 'mongodb://localhost:27017')
+        self.mongo_uri = mongo_uri or _DEFAULT_URI
         self.test_mode = test_mode
-        self.client = None
+        self._client = None
         self.db = None
         self.collection = None
         self.connection_info = {}
+        self.out_dir = Path(out_dir)
         
-        # Generate unique database/collection names for testing
-        if test_mode:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            self.db_name = f'mcp_test_logs_{timestamp}'
-            self.collection_name = f'tool_executions_{timestamp}'
-        else:
-            self.db_name = os.getenv('MONGODB_LOGGER_DB', 'mcp_tool_logs')
-            self.collection_name = os.getenv('MONGODB_LOGGER_COLLECTION', 'tool_executions')
+        # Single timestamp shared by the generated names and every timestamp
+        # recorded during bootstrap, so they all agree with each other
+        self._bootstrap_now = datetime.now()
+        self.db_name, self.collection_name = self._generate_names()
+    
+    def _generate_names(self):
+        """
+        Generate database/collection names, unique per bootstrap in test mode
+        """
+        if self.test_mode:
+            timestamp = self._bootstrap_now.strftime('%Y%m%d_%H%M%S')
+            return f'mcp_test_logs_{timestamp}', f'tool_executions_{timestamp}'
+        
+        return _DEFAULT_DB, _DEFAULT_COLL
+    
+    @property
+    def client(self):
+        """
+        MongoDB client, created on first use so runs that never talk to the
+        server skip option parsing and topology monitoring thread startup
+        """
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+    
+    def _create_client(self):
+        """
+        Create the MongoClient with the bootstrap connection options
+        """
+        # Timeouts default to values suited to remote deployments; lower
+        # them for local development or CI to fail fast
+        server_selection_timeout_ms = int(os.getenv('MONGODB_SERVER_SELECTION_TIMEOUT_MS', '5000'))
+        connect_timeout_ms = int(os.getenv('MONGODB_CONNECT_TIMEOUT_MS', '10000'))
+        socket_timeout_ms = int(os.getenv('MONGODB_SOCKET_TIMEOUT_MS', '10000'))
+        
+        # Connection options for reliability
+        client_options = {
+            'serverSelectionTimeoutMS': server_selection_timeout_ms,
+            'connectTimeoutMS': connect_timeout_ms,
+            'socketTimeoutMS': socket_timeout_ms,
+            'maxPoolSize': 10,                 # Maximum connections in pool
+            'retryWrites': True,               # Enable retry writes
+            'w': 'majority',                   # Write concern
+            'readConcernLevel': 'majority',    # Only read majority-committed data
+            'maxIdleTimeMS': 30000             # 30 second max idle time
+        }
+        
+        # Options set explicitly in the URI query string take precedence
+        # over these defaults, regardless of keyword argument handling
+        uri_options = self._get_uri_options()
+        client_options = {
+            name: value for name, value in client_options.items()
+            if name.lower() not in uri_options
+        }
+        
+        return MongoClient(self.mongo_uri, **client_options)
     
     def connect_to_mongodb(self):
         """
         Establish connection to MongoDB with proper error handling
         """
         try:
-            print(f"Connecting to MongoDB at: {self.mongo_uri}")
-            
-            # Connection options for reliability
-            self.client = MongoClient(
-                self.mongo_uri,
-                serverSelectionTimeoutMS=5000,  # 5 second timeout
-                connectTimeoutMS=10000,         # 10 second connection timeout
-                socketTimeoutMS=10000,          # 10 second socket timeout
-                maxPoolSize=10,                 # Maximum connections in pool
-                retryWrites=True,               # Enable retry writes
-                w='majority',                   # Write concern
-                maxIdleTimeMS=30000             # 30 second max idle time
-            )
+            logger.info(f"Connecting to MongoDB at: {self.mongo_uri}")
             
             # Test the connection
             self.client.admin.command('ping')
             
-            # Get server info
-            server_info = self.client.server_info()
+            # Server details come from the monitoring handshake that already
+            # ran, avoiding a second buildInfo round-trip just for a version
+            server_description = self._get_server_description()
             
             self.connection_info = {
                 'status': 'connected',
                 'mongo_uri': self.mongo_uri,
-                'server_version': server_info.get('version'),
-                'connection_time': datetime.now().isoformat(),
+                'server_version': None,
+                'server_type': server_description.server_type_name if server_description else None,
+                'max_wire_version': server_description.max_wire_version if server_description else None,
+                'connection_time': self._bootstrap_now.isoformat(),
                 'database_name': self.db_name,
                 'collection_name': self.collection_name
             }
             
-            print(f"✓ Successfully connected to MongoDB {server_info.get('version')}")
+            logger.info(f"✓ Successfully connected to MongoDB ({self.connection_info['server_type']}, "
+                        f"wire version {self.connection_info['max_wire_version']})")
             return True
             
         except errors.ServerSelectionTimeoutError:
             error_msg = f"Could not connect to MongoDB at {self.mongo_uri} - Check if MongoDB is running"
-            print(f"✗ {error_msg}")
+            logger.error(f"✗ {error_msg}")
             self.connection_info = {'status': 'failed', 'error': error_msg}
             return False
             
         except errors.ConfigurationError as e:
             error_msg = f"MongoDB configuration error: {e}"
-            print(f"✗ {error_msg}")
+            logger.error(f"✗ {error_msg}")
             self.connection_info = {'status': 'failed', 'error': error_msg}
             return False
             
         except Exception as e:
             error_msg = f"Unexpected error connecting to MongoDB: {e}"
-            print(f"✗ {error_msg}")
+            logger.error(f"✗ {error_msg}")
             self.connection_info = {'status': 'failed', 'error': error_msg}
             return False
     
+    def _get_uri_options(self):
+        """
+        Get the options given in the MongoDB URI query string, keyed by
+        lowercased name. Uses pymongo's own option splitting so both '&' and
+        ';' separators are recognised; values are validated by MongoClient
+        """
+        query = urlsplit(self.mongo_uri).query
+        if not query:
+            return {}
+        
+        options = split_options(query, validate=False, warn=False, normalize=False)
+        return {name.lower(): value for name, value in options.items()}
+    
+    def _get_server_description(self):
+        """
+        Get the description of a connected server from the client's topology,
+        preferring a writable one (the primary on replica sets)
+        """
+        known = [
+            description
+            for description in self.client.topology_description.server_descriptions().values()
+            if description.is_server_type_known
+        ]
+        writable = [description for description in known if description.is_writable]
+        
+        return (writable or known or [None])[0]
+    
     def setup_database_and_collection(self):
         """
         Create database and collection with proper indexing
@@ -109,28 +211,42 @@ class MongoLoggerBootstrap:
             # Get collection handle
             self.collection = self.db[self.collection_name]
             
-            print(f"✓ Database '{self.db_name}' ready")
-            print(f"✓ Collection '{self.collection_name}' ready")
+            logger.info(f"✓ Database '{self.db_name}' ready")
+            logger.info(f"✓ Collection '{self.collection_name}' ready")
             
             # Create indexes for optimal query performance
             indexes_created = self.create_indexes()
+            if indexes_created is None:
+                return False
             
             # Insert a test document to verify write permissions
             test_doc = {
                 '_id': 'bootstrap_test',
                 'type': 'bootstrap_verification',
-                'timestamp': datetime.now(),
+                'timestamp': self._bootstrap_now,
                 'test_mode': self.test_mode,
                 'created_by': 'bootstrap_mongo_logger.py'
             }
             
-            self.collection.insert_one(test_doc)
-            print("✓ Test document inserted successfully")
+            # The verification doc is throwaway, so acknowledge on the primary
+            # only instead of waiting for the client-level w='majority'; the
+            # returned document already confirms the write landed
+            verify_collection = self.collection.with_options(
+                write_concern=WriteConcern(w=1)
+            )
             
-            # Verify we can read it back
-            retrieved = self.collection.find_one({'_id': 'bootstrap_test'})
+            # Write and read back in a single round-trip; upserting keeps
+            # re-runs against the same collection from failing on the _id
+            retrieved = verify_collection.find_one_and_replace(
+                {'_id': 'bootstrap_test'},
+                test_doc,
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
             if retrieved:
-                print("✓ Test document retrieval successful")
+                logger.info("✓ Test document written and retrieved successfully")
+            else:
+                logger.warning("⚠ Test document write could not be verified")
             
             self.connection_info.update({
                 'database_created': True,
@@ -143,13 +259,17 @@ class MongoLoggerBootstrap:
             
         except Exception as e:
             error_msg = f"Failed to setup database/collection: {e}"
-            print(f"✗ {error_msg}")
+            logger.error(f"✗ {error_msg}")
             self.connection_info['setup_error'] = error_msg
             return False
     
     def create_indexes(self):
         """
         Create database indexes for optimal query performance
+        
+        Returns:
+            list: Names of the created indexes, or None if the server rejected
+                the batch; the failure is then recorded in connection_info
         """
         indexes = [
             ('toolName', 1),           # Tool name ascending
@@ -164,41 +284,94 @@ class MongoLoggerBootstrap:
             [('success', 1), ('startTime', -1)],       # Success + time queries
         ]
         
-        indexes_created = []
+        # Compute each index name once and pass it explicitly, so the names
+        # reported back always match the specs and the server needn't derive them
+        single_specs = [([(field, direction)], f"{field}_{direction}") for field, direction in indexes]
+        compound_specs = [
+            (compound_fields, "_".join(f"{field}_{direction}" for field, direction in compound_fields))
+            for compound_fields in compound_indexes
+        ]
+        specs = single_specs + compound_specs
+        
+        # Servers before 4.2 (wire version 8) hold an exclusive lock for
+        # foreground builds, stalling live logger writes on an existing
+        # collection; newer servers ignore the background option
+        max_wire_version = self.connection_info.get('max_wire_version')
+        if max_wire_version is not None and max_wire_version < 8:
+            logger.warning("  ⚠ MongoDB server is older than 4.2 - indexes will be built in the background")
+        
+        # Build every index spec up front so they go to the server as one
+        # createIndexes command instead of one round-trip per index
+        models = [IndexModel(keys, name=name, background=True) for keys, name in specs]
         
+        # createIndexes is idempotent for identical specs, so re-running the
+        # bootstrap needs no existence check; only conflicting specs fail
         try:
-            # Create single field indexes
-            for field, direction in indexes:
-                try:
-                    index_name = self.collection.create_index([(field, direction)])
-                    indexes_created.append(f"{field}_{direction}")
-                    print(f"  ✓ Index created: {field} ({direction})")
-                except Exception as e:
-                    print(f"  ⚠ Index creation failed for {field}: {e}")
+            indexes_created = self.collection.create_indexes(models)
+            logger.info(f"  ✓ Indexes created: {', '.join(indexes_created)}")
+            return indexes_created
             
-            # Create compound indexes
-            for compound_fields in compound_indexes:
-                try:
-                    index_name = self.collection.create_index(compound_fields)
-                    field_names = "_".join([f"{field}_{direction}" for field, direction in compound_fields])
-                    indexes_created.append(field_names)
-                    print(f"  ✓ Compound index created: {field_names}")
-                except Exception as e:
-                    field_names = "_".join([field for field, _ in compound_fields])
-                    print(f"  ⚠ Compound index creation failed for {field_names}: {e}")
+        except errors.OperationFailure as e:
+            # The server rejects the whole batch, so none of the indexes exist
+            if e.code == 85:  # IndexOptionsConflict
+                reason = "an existing index has the same keys but a different name or options"
+            elif e.code == 86:  # IndexKeySpecsConflict
+                reason = "an existing index has the same name but different keys"
+            else:
+                reason = str(e)
             
-            return indexes_created
+            conflicting = self._find_conflicting_indexes(specs) if e.code in (85, 86) else []
+            self.connection_info['index_error'] = {
+                'code': e.code,
+                'reason': reason,
+                'conflicting_indexes': conflicting,
+                'details': str(e)
+            }
             
-        except Exception as e:
-            print(f"  ✗ Index creation error: {e}")
+            conflict_names = f" ({', '.join(conflicting)})" if conflicting else ""
+            logger.error(f"  ✗ No indexes were created - {reason}{conflict_names}")
+            return None
+    
+    def _find_conflicting_indexes(self, specs):
+        """
+        Get the names of requested indexes that clash with an existing index,
+        either by name with different keys or by keys under a different name.
+        Only called on the error path, so the extra listIndexes round-trip
+        doesn't affect a normal bootstrap
+        """
+        try:
+            existing = [
+                (index['name'], list(index['key'].items()))
+                for index in self.collection.list_indexes()
+            ]
+        except Exception:
             return []
+        
+        conflicting = []
+        same_spec = []
+        for keys, name in specs:
+            for existing_name, existing_keys in existing:
+                same_name = existing_name == name
+                same_keys = existing_keys == list(keys)
+                if same_name != same_keys:
+                    conflicting.append(f"{name} vs existing {existing_name}")
+                elif same_name:
+                    same_spec.append(name)
+        
+        # With no name/key mismatch, an options conflict can only come from an
+        # index with the same name and keys, e.g. one created as unique
+        return conflicting or same_spec
     
-    def export_collection_handle(self):
+    def export_collection_handle(self, require_collection=True):
         """
         Export collection configuration for use by MongoToolLogger
+        
+        Args:
+            require_collection (bool): If False, export even without a collection
+                handle, e.g. for a dry run that never connects
         """
-        if not self.collection:
-            print("✗ No collection handle to export")
+        if require_collection and self.collection is None:
+            logger.error("✗ No collection handle to export")
             return None
         
         # Create configuration object
@@ -207,17 +380,24 @@ class MongoLoggerBootstrap:
             'database_name': self.db_name,
             'collection_name': self.collection_name,
             'connection_info': self.connection_info,
-            'bootstrap_timestamp': datetime.now().isoformat(),
+            'bootstrap_timestamp': self._bootstrap_now.isoformat(),
             'test_mode': self.test_mode
         }
         
         # Save configuration to file for Node.js MongoToolLogger
-        config_file = 'mongo_logger_config.json'
+        config_file = self.out_dir / 'mongo_logger_config.json'
+        env_file = self.out_dir / 'mongo_logger_env.sh'
         try:
-            with open(config_file, 'w') as f:
-                json.dump(mongo_config, f, indent=2, default=str)
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            
+            if orjson is not None:
+                config_bytes = orjson.dumps(mongo_config, option=orjson.OPT_INDENT_2, default=str)
+            else:
+                config_bytes = json.dumps(mongo_config, indent=2, default=str).encode('utf-8')
+            
+            config_file.write_bytes(config_bytes)
             
-            print(f"✓ Configuration exported to {config_file}")
+            logger.info(f"✓ Configuration exported to {config_file}")
             
             # Also create environment variable exports
             env_exports = f"""
@@ -227,87 +407,107 @@ export MONGODB_LOGGER_DB="{self.db_name}"
 export MONGODB_LOGGER_COLLECTION="{self.collection_name}"
 """
             
-            env_file = 'mongo_logger_env.sh'
-            with open(env_file, 'w') as f:
-                f.write(env_exports)
+            env_file.write_text(env_exports, encoding='utf-8')
             
-            print(f"✓ Environment exports saved to {env_file}")
-            print("\nTo use this configuration, run:")
-            print(f"  source {env_file}")
+            logger.info(f"✓ Environment exports saved to {env_file}")
+            logger.info("\nTo use this configuration, run:")
+            logger.info(f"  source {env_file}")
             
             return mongo_config
             
         except Exception as e:
-            print(f"✗ Failed to export configuration: {e}")
+            logger.error(f"✗ Failed to export configuration: {e}")
             return None
     
-    def get_collection_stats(self):
+    def get_collection_stats(self, verbose=False):
         """
         Get collection statistics and information
+        
+        Args:
+            verbose (bool): If True, also run collStats for size metrics. This is
+                a heavyweight admin command, so by default only the cheap
+                metadata-based count and index listing are used.
         """
-        if not self.collection:
+        if self.collection is None:
             return None
         
         try:
-            stats = self.db.command('collStats', self.collection_name)
-            
             collection_info = {
-                'document_count': stats.get('count', 0),
-                'size_bytes': stats.get('size', 0),
-                'average_document_size': stats.get('avgObjSize', 0),
-                'indexes': stats.get('nindexes', 0),
-                'total_index_size': stats.get('totalIndexSize', 0)
+                'document_count': self.collection.estimated_document_count(),
+                'indexes': sum(1 for _ in self.collection.list_indexes())
             }
             
+            if verbose:
+                stats = self.db.command({'collStats': self.collection_name, 'scale': 1, 'indexDetails': False})
+                collection_info.update({
+                    'size_bytes': stats.get('size', 0),
+                    'average_document_size': stats.get('avgObjSize', 0),
+                    'total_index_size': stats.get('totalIndexSize', 0)
+                })
+            
             return collection_info
             
         except Exception as e:
-            print(f"Warning: Could not get collection stats: {e}")
+            logger.warning(f"Warning: Could not get collection stats: {e}")
             return None
     
-    def run_bootstrap(self):
+    def dry_run(self):
+        """
+        Export the configuration files without contacting MongoDB; the client
+        is never created, so no monitoring threads or network probes start
+        """
+        logger.info("Dry run - MongoDB will not be contacted")
+        self.connection_info = {'status': 'dry_run'}
+        
+        return self.export_collection_handle(require_collection=False) is not None
+    
+    def run_bootstrap(self, verbose_stats=False):
         """
         Run complete bootstrap process
+        
+        Args:
+            verbose_stats (bool): If True, include collStats size metrics in the summary
         """
-        print("\n" + "="*60)
-        print("MongoDB Logger Bootstrap Starting...")
-        print("="*60)
+        logger.info("\n" + "="*60)
+        logger.info("MongoDB Logger Bootstrap Starting...")
+        logger.info("="*60)
         
         # Step 1: Connect to MongoDB
         if not self.connect_to_mongodb():
-            print("\n✗ Bootstrap failed - Could not connect to MongoDB")
+            logger.error("\n✗ Bootstrap failed - Could not connect to MongoDB")
             return False
         
         # Step 2: Setup database and collection
         if not self.setup_database_and_collection():
-            print("\n✗ Bootstrap failed - Could not setup database/collection")
+            logger.error("\n✗ Bootstrap failed - Could not setup database/collection")
             return False
         
         # Step 3: Export configuration
         config = self.export_collection_handle()
         if not config:
-            print("\n✗ Bootstrap failed - Could not export configuration")
+            logger.error("\n✗ Bootstrap failed - Could not export configuration")
             return False
         
         # Step 4: Display summary
-        stats = self.get_collection_stats()
+        stats = self.get_collection_stats(verbose=verbose_stats)
         
-        print("\n" + "="*60)
-        print("✓ MongoDB Logger Bootstrap Complete!")
-        print("="*60)
-        print(f"Database: {self.db_name}")
-        print(f"Collection: {self.collection_name}")
-        print(f"MongoDB URI: {self.mongo_uri}")
+        logger.info("\n" + "="*60)
+        logger.info("✓ MongoDB Logger Bootstrap Complete!")
+        logger.info("="*60)
+        logger.info(f"Database: {self.db_name}")
+        logger.info(f"Collection: {self.collection_name}")
+        logger.info(f"MongoDB URI: {self.mongo_uri}")
         
         if stats:
-            print(f"\nCollection Stats:")
-            print(f"  Documents: {stats['document_count']}")
-            print(f"  Indexes: {stats['indexes']}")
-            print(f"  Size: {stats['size_bytes']} bytes")
+            logger.info(f"\nCollection Stats:")
+            logger.info(f"  Documents: {stats['document_count']}")
+            logger.info(f"  Indexes: {stats['indexes']}")
+            if 'size_bytes' in stats:
+                logger.info(f"  Size: {stats['size_bytes']} bytes")
         
-        print(f"\nConfiguration files created:")
-        print(f"  - mongo_logger_config.json")
-        print(f"  - mongo_logger_env.sh")
+        logger.info(f"\nConfiguration files created:")
+        logger.info(f"  - {self.out_dir / 'mongo_logger_config.json'}")
+        logger.info(f"  - {self.out_dir / 'mongo_logger_env.sh'}")
         
         return True
     
@@ -315,12 +515,12 @@ export MONGODB_LOGGER_COLLECTION="{self.collection_name}"
         """
         Clean up resources
         """
-        if self.client:
+        if self._client is not None:
             try:
-                self.client.close()
-                print("✓ MongoDB connection closed")
+                self._client.close()
+                logger.info("✓ MongoDB connection closed")
             except Exception as e:
-                print(f"Warning: Error closing MongoDB connection: {e}")
+                logger.warning(f"Warning: Error closing MongoDB connection: {e}")
 
 def main():
     """
@@ -346,39 +546,68 @@ def main():
         action='store_true',
         help='Only test the MongoDB connection without creating databases'
     )
+    parser.add_argument(
+        '--verbose-stats', 
+        action='store_true',
+        help='Include collStats size metrics in the bootstrap summary (slower on large collections)'
+    )
+    parser.add_argument(
+        '--out-dir', 
+        default='.',
+        help='Directory to write the generated configuration files to (default: current directory). '
+             'utils/mongodb-logger.js only reads ./mongo_logger_config.json from its working directory, '
+             'so with another directory it must be run from there or configured manually'
+    )
+    parser.add_argument(
+        '--dry-run', 
+        action='store_true',
+        help='Only generate the configuration files, without contacting MongoDB'
+    )
     
     args = parser.parse_args()
     
+    # Plain messages on stdout, matching the script's console output
+    handler = _BufferedStreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    
     # Create bootstrap instance
     bootstrap = MongoLoggerBootstrap(
         mongo_uri=args.mongo_uri,
-        test_mode=not args.production
+        test_mode=not args.production,
+        out_dir=args.out_dir
     )
     
     try:
-        if args.test_connection_only:
+        if args.dry_run:
+            # Generate names and config files only
+            success = bootstrap.dry_run()
+            sys.exit(0 if success else 1)
+        elif args.test_connection_only:
             # Just test connection
-            print("Testing MongoDB connection...")
+            logger.info("Testing MongoDB connection...")
             success = bootstrap.connect_to_mongodb()
             if success:
-                print("✓ MongoDB connection test successful!")
+                logger.info("✓ MongoDB connection test successful!")
                 sys.exit(0)
             else:
-                print("✗ MongoDB connection test failed!")
+                logger.error("✗ MongoDB connection test failed!")
                 sys.exit(1)
         else:
             # Run full bootstrap
-            success = bootstrap.run_bootstrap()
+            success = bootstrap.run_bootstrap(verbose_stats=args.verbose_stats)
             sys.exit(0 if success else 1)
             
     except KeyboardInterrupt:
-        print("\n\nBootstrap interrupted by user")
+        logger.info("\n\nBootstrap interrupted by user")
         sys.exit(1)
     except Exception as e:
-        print(f"\n✗ Unexpected error: {e}")
+        logger.error(f"\n✗ Unexpected error: {e}")
         sys.exit(1)
     finally:
         bootstrap.cleanup()
+        handler.flush()
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,107 @@
+"""
+Offline unit tests for bootstrap_mongo_logger.py
+
+These tests never contact a MongoDB server. Run with:
+    python -m unittest discover -s test/unit -p 'test_*.py'
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from pymongo import errors
+
+from bootstrap_mongo_logger import MongoLoggerBootstrap
+
+
+class UriOptionsTest(unittest.TestCase):
+    def test_no_query_string(self):
+        bootstrap = MongoLoggerBootstrap(mongo_uri='mongodb://localhost:27017')
+        self.assertEqual(bootstrap._get_uri_options(), {})
+
+    def test_ampersand_separator(self):
+        bootstrap = MongoLoggerBootstrap(mongo_uri='mongodb://localhost:27017/?w=1&maxPoolSize=3')
+        self.assertEqual(set(bootstrap._get_uri_options()), {'w', 'maxpoolsize'})
+
+    def test_semicolon_separator(self):
+        bootstrap = MongoLoggerBootstrap(mongo_uri='mongodb://localhost:27017/?w=1;maxPoolSize=3')
+        self.assertEqual(set(bootstrap._get_uri_options()), {'w', 'maxpoolsize'})
+
+    def test_mixed_case_names(self):
+        bootstrap = MongoLoggerBootstrap(
+            mongo_uri='mongodb://h1:27017,h2:27017/db?ServerSelectionTimeoutMS=500&READCONCERNLEVEL=local'
+        )
+        self.assertEqual(
+            bootstrap._get_uri_options(),
+            {'serverselectiontimeoutms': '500', 'readconcernlevel': 'local'}
+        )
+
+    def test_uri_options_override_defaults(self):
+        bootstrap = MongoLoggerBootstrap(mongo_uri='mongodb://localhost:27017/?w=1;maxPoolSize=3')
+        with mock.patch('bootstrap_mongo_logger.MongoClient') as client_class:
+            bootstrap._create_client()
+
+        options = client_class.call_args.kwargs
+        self.assertNotIn('w', options)
+        self.assertNotIn('maxPoolSize', options)
+
+
+class CreateIndexesTest(unittest.TestCase):
+    def test_key_specs_conflict_fails_and_is_recorded(self):
+        bootstrap = MongoLoggerBootstrap()
+        bootstrap.collection = mock.Mock()
+        bootstrap.collection.create_indexes.side_effect = errors.OperationFailure(
+            'An existing index has the same name as the requested index', code=86
+        )
+        bootstrap.collection.list_indexes.return_value = [
+            {'name': '_id_', 'key': {'_id': 1}},
+            {'name': 'toolName_1', 'key': {'toolName': -1}},
+        ]
+
+        self.assertIsNone(bootstrap.create_indexes())
+
+        index_error = bootstrap.connection_info['index_error']
+        self.assertEqual(index_error['code'], 86)
+        self.assertIn('same name but different keys', index_error['reason'])
+        self.assertEqual(index_error['conflicting_indexes'], ['toolName_1 vs existing toolName_1'])
+
+    def test_other_failure_fails_setup_and_is_logged_once(self):
+        bootstrap = MongoLoggerBootstrap()
+        bootstrap._client = mock.MagicMock()
+        collection = bootstrap._client.__getitem__.return_value.__getitem__.return_value
+        collection.create_indexes.side_effect = errors.OperationFailure('not authorized', code=13)
+
+        with self.assertLogs('mongo_bootstrap', level='ERROR') as captured:
+            self.assertFalse(bootstrap.setup_database_and_collection())
+
+        self.assertEqual(len(captured.records), 1)
+        self.assertEqual(bootstrap.connection_info['index_error']['reason'], 'not authorized')
+        collection.with_options.assert_not_called()
+
+
+class DryRunTest(unittest.TestCase):
+    def test_dry_run_writes_files_without_a_client(self):
+        with tempfile.TemporaryDirectory() as out_dir:
+            bootstrap = MongoLoggerBootstrap(out_dir=out_dir)
+            with mock.patch('bootstrap_mongo_logger.MongoClient') as client_class:
+                self.assertTrue(bootstrap.dry_run())
+
+            client_class.assert_not_called()
+            self.assertIsNone(bootstrap._client)
+
+            config_file = Path(out_dir) / 'mongo_logger_config.json'
+            env_file = Path(out_dir) / 'mongo_logger_env.sh'
+            self.assertTrue(env_file.is_file())
+            config = json.loads(config_file.read_text(encoding='utf-8'))
+            self.assertEqual(config['connection_info'], {'status': 'dry_run'})
+            self.assertEqual(config['database_name'], bootstrap.db_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
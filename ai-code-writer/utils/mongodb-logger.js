@@ -85,12 +85,19 @@ class MongoDBLogger {
 
   async _performConnection() {
     try {
+      // Size the pool for concurrent tool-execution logging; the driver
+      // rejects minPoolSize > maxPoolSize, so the minimum is capped
+      const maxPoolSize = parseInt(process.env.MONGODB_MAX_POOL || '200', 10);
+      const minPoolSize = Math.min(parseInt(process.env.MONGODB_MIN_POOL || '10', 10), maxPoolSize);
+      
       this.client = new MongoClient(this.mongoUri, {
-        maxPoolSize: 10,
+        maxPoolSize,
+        minPoolSize,
+        waitQueueTimeoutMS: 5000,
         serverSelectionTimeoutMS: 5000,
         socketTimeoutMS: 10000,
         connectTimeoutMS: 10000,
-        maxIdleTimeMS: 30000
+        maxIdleTimeMS: 300000
       });
       
       await this.client.connect();